@@ -0,0 +1,96 @@
+import os
+import sys
+import time
+import shutil
+import tempfile
+import argparse
+
+# Add the parent directory to the sys.path to import combine_code
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from combine_code import walk_directory
+
+TMPFS_DIR = "/dev/shm"  # Memory-backed filesystem on most Linux systems
+
+# Function to build a synthetic tree of roughly dir_count directories
+def build_tree(root_dir, dir_count, fanout, files_per_dir):
+    """
+    Builds a tree breadth-first until dir_count directories exist.
+    Args:
+        root_dir (str): Directory to build the tree in.
+        dir_count (int): Number of directories to create.
+        fanout (int): Number of subdirectories per directory.
+        files_per_dir (int): Number of empty files per directory.
+    """
+    queue = [root_dir]
+    created = 0
+    while queue and created < dir_count:
+        parent = queue.pop(0)
+        for i in range(fanout):
+            if created >= dir_count:
+                break
+            child = os.path.join(parent, f"d{i}")
+            os.mkdir(child)
+            for j in range(files_per_dir):
+                open(os.path.join(child, f"f{j}.py"), 'w').close()
+            queue.append(child)
+            created += 1
+
+# Function to wrap os.scandir with a fixed per-call delay, simulating an NFS/FUSE round-trip
+def make_latency_scandir(latency):
+    def latency_scandir(path):
+        time.sleep(latency)
+        return os.scandir(path)
+    return latency_scandir
+
+# Function to time a full traversal
+def time_walk(walk):
+    start = time.perf_counter()
+    dirs = sum(1 for _ in walk)
+    return time.perf_counter() - start, dirs
+
+# Function to print one benchmark result line
+def report(label, elapsed, dirs, baseline=None):
+    speedup = f"  ({baseline / elapsed:.1f}x)" if baseline else ""
+    print(f"  {label:<36} {elapsed:8.3f}s  {dirs} dirs{speedup}")
+
+# Main function
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark concurrent directory traversal.")
+    parser.add_argument("--dirs", type=int, default=5000, help="Number of directories in the tmpfs tree. Defaults to 5000.")
+    parser.add_argument("--latency-dirs", type=int, default=1000, help="Number of directories in the high-latency tree. Defaults to 1000.")
+    parser.add_argument("--fanout", type=int, default=8, help="Subdirectories per directory. Defaults to 8.")
+    parser.add_argument("--files", type=int, default=4, help="Files per directory. Defaults to 4.")
+    parser.add_argument("--latency", type=float, default=0.002, help="Simulated seconds per directory listing. Defaults to 0.002.")
+    parser.add_argument("--workers", type=int, nargs='+', default=[1, 4, 16, 32], help="Worker counts to compare.")
+
+    args = parser.parse_args()
+
+    base_dir = TMPFS_DIR if os.path.isdir(TMPFS_DIR) else None
+    root_dir = tempfile.mkdtemp(prefix="bench_traversal_", dir=base_dir)
+    try:
+        print(f"Local tree in {root_dir} ({args.dirs} dirs, fanout {args.fanout}, {args.files} files/dir)")
+        build_tree(root_dir, args.dirs, args.fanout, args.files)
+
+        baseline, dirs = time_walk(os.walk(root_dir))
+        report("os.walk", baseline, dirs)
+        for workers in args.workers:
+            elapsed, dirs = time_walk(walk_directory(root_dir, max_workers=workers))
+            report(f"walk_directory (workers={workers})", elapsed, dirs, baseline)
+
+        latency_root = os.path.join(root_dir, "latency")
+        os.mkdir(latency_root)
+        build_tree(latency_root, args.latency_dirs, args.fanout, args.files)
+        latency_scandir = make_latency_scandir(args.latency)
+
+        print(f"\nSimulated high-latency backend ({args.latency_dirs} dirs, {args.latency * 1000:.1f}ms per listing)")
+        baseline = None
+        for workers in args.workers:
+            elapsed, dirs = time_walk(walk_directory(latency_root, max_workers=workers, scandir=latency_scandir))
+            report(f"walk_directory (workers={workers})", elapsed, dirs, baseline)
+            baseline = baseline or elapsed
+    finally:
+        shutil.rmtree(root_dir)
+
+if __name__ == "__main__":
+    main()
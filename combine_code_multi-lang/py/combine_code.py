@@ -2,7 +2,9 @@ import os
 import fnmatch
 import sys
 import json
+import heapq
 import argparse # Import argparse for command-line argument parsing
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 # Constants
 OUTPUT_FILE = "code.copy"
@@ -12,6 +14,9 @@ CONFIG_FILE = "combine_code_config.json"  # Updated config file name to reflect
 DEBUG_MODE = False  # Global variable to track debug mode
 MODE = "blacklist"  # Default mode is blacklist
 MAX_RECENT_PATHS = 10  # Maximum number of recent paths to store
+MAX_WORKERS = 16  # Number of threads listing directories concurrently during traversal
+QUEUE_DEPTH_PER_WORKER = 2  # Directory listings queued on the pool, per worker
+MAX_LISTINGS_AHEAD = 4096  # Finished directory listings held ahead of the consumer
 
 # Function to load recent directories from config file
 def load_recent_directories_from_config(config_file):
@@ -120,6 +125,159 @@ def should_process(path, patterns, root_dir): # Add root_dir parameter
             print(f"DEBUG: {'Processing' if result else 'Ignoring'} {relative_path} (Whitelist Mode)")
         return result
 
+# List a single directory, returning sorted names so traversal order is deterministic
+def _scan_directory(dir_path, scandir):
+    """
+    Lists one directory. Runs on a worker thread.
+    Args:
+        dir_path (str): The directory to list.
+        scandir (callable): Function with the same contract as os.scandir.
+    Returns:
+        tuple or None: (dirnames, filenames, walk_into) with sorted names, where walk_into
+        is the set of subdirectories that are not symlinks. None if the directory
+        cannot be listed (mirrors os.walk, which silently skips such directories).
+    """
+    dirnames = []
+    filenames = []
+    walk_into = set()
+    try:
+        with scandir(dir_path) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                if is_dir:
+                    dirnames.append(entry.name)
+                    try:
+                        if not entry.is_symlink():
+                            walk_into.add(entry.name)
+                    except OSError:
+                        pass
+                else:
+                    filenames.append(entry.name)
+    except OSError:
+        return None
+
+    dirnames.sort()
+    filenames.sort()
+    return dirnames, filenames, walk_into
+
+# Walk a directory tree, listing directories concurrently
+def walk_directory(root_dir, prune=None, max_workers=None, scandir=os.scandir):
+    """
+    Drop-in replacement for a top-down os.walk that fans directory listings out across
+    a thread pool, which hides round-trip latency on network and FUSE filesystems.
+    Results are yielded in sorted pre-order regardless of which listing finishes first.
+    Args:
+        root_dir (str): The root directory to walk.
+        prune (callable): Optional predicate taking a directory path. Directories for which
+            it returns True are dropped from dirnames and never scheduled for listing.
+        max_workers (int): Number of listing threads. Defaults to MAX_WORKERS.
+        scandir (callable): Function with the same contract as os.scandir.
+    Yields:
+        tuple: (dirpath, dirnames, filenames), as os.walk does. Removing entries from
+        dirnames stops the walk from descending into them; a removed directory may
+        already have been listed ahead of time, but nothing below it is.
+    """
+    max_workers = max_workers or MAX_WORKERS
+    max_queued = max_workers * QUEUE_DEPTH_PER_WORKER
+
+    futures = {}  # Future -> directory path, for listings still running
+    listings = {}  # Directory path -> finished listing not yet yielded
+    scheduled = set()
+    # Prefetch heap keyed by path components, whose sort order is the order directories are yielded in
+    to_schedule = [((), root_dir)]
+    sort_keys = {root_dir: ()}
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def submit(dir_path):
+        scheduled.add(dir_path)
+        futures[executor.submit(_scan_directory, dir_path, scandir)] = dir_path
+
+    def schedule_ahead():
+        # Bounded queue: keep the workers fed, but stop prefetching once enough listings wait on the consumer
+        while to_schedule and len(futures) < max_queued and len(listings) < MAX_LISTINGS_AHEAD:
+            _, dir_path = heapq.heappop(to_schedule)
+            # Paths without a sort key were dropped from dirnames by the consumer
+            if dir_path not in scheduled and dir_path in sort_keys:
+                submit(dir_path)
+
+    def collect(done):
+        for future in done:
+            dir_path = futures.pop(future)
+            listing = future.result()
+            if dir_path not in sort_keys:
+                continue  # Dropped from dirnames while the listing was running
+            if listing is not None:
+                dirnames, filenames, walk_into = listing
+                if prune is not None:
+                    dirnames = [d for d in dirnames if not prune(os.path.join(dir_path, d))]
+                    walk_into = walk_into.intersection(dirnames)
+                parent_key = sort_keys[dir_path]
+                for dirname in walk_into:
+                    child_path = os.path.join(dir_path, dirname)
+                    sort_keys[child_path] = parent_key + (dirname,)
+                    heapq.heappush(to_schedule, (sort_keys[child_path], child_path))
+                listing = (dirnames, filenames, walk_into)
+            listings[dir_path] = listing
+
+    try:
+        stack = [root_dir]
+        while stack:
+            dir_path = stack.pop()
+            if dir_path not in scheduled:
+                # Needed now; bypasses the prefetch bound so the walk always makes progress
+                submit(dir_path)
+            # Expand every listing that has finished so idle workers pick up its children
+            collect([future for future in futures if future.done()])
+            schedule_ahead()
+            while dir_path not in listings:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                collect(done)
+                schedule_ahead()
+
+            listing = listings.pop(dir_path)
+            dir_key = sort_keys.pop(dir_path)
+            if listing is None:
+                continue
+            dirnames, filenames, walk_into = listing
+            yield dir_path, dirnames, filenames
+
+            # Forget prefetched work below any directory the consumer removed from dirnames
+            removed = {dir_key + (dirname,) for dirname in walk_into.difference(dirnames)}
+            if removed:
+                for path, key in list(sort_keys.items()):
+                    if key[:len(dir_key) + 1] in removed:
+                        del sort_keys[path]
+                        listings.pop(path, None)
+
+            for dirname in reversed(dirnames):
+                if dirname in walk_into:
+                    stack.append(os.path.join(dir_path, dirname))
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+# Decide whether traversal should skip a directory entirely
+def is_pruned_directory(dir_path, patterns, root_dir):
+    """
+    Directories are only pruned in blacklist mode; in whitelist mode a file further
+    down may still match, so every directory has to be visited.
+    Args:
+        dir_path (str): The directory to check.
+        patterns (list): List of patterns to match against.
+        root_dir (str): The root directory being processed.
+    Returns:
+        bool: True if the directory and everything below it should be skipped.
+    """
+    if MODE != "blacklist" or should_process(dir_path, patterns, root_dir):
+        return False
+    if DEBUG_MODE:
+        print(f"DEBUG: Pruning directory from walk (blacklist): {dir_path}")
+    return True
+
 # Generate the directory and file structure
 def generate_structure(root_dir, patterns, apply_filter_to_structure):
     """
@@ -132,22 +290,12 @@ def generate_structure(root_dir, patterns, apply_filter_to_structure):
         list: A list of strings representing the structure.
     """
     structure = []
-    for dirpath, dirnames, filenames in os.walk(root_dir):
-        # Decide whether to prune directories from the walk (only in blacklist mode)
-        if apply_filter_to_structure and MODE == "blacklist":
-            dirs_to_prune_indices = []
-            for i in range(len(dirnames)):
-                dirname = dirnames[i]
-                dir_full_path = os.path.join(dirpath, dirname)
-                # In blacklist mode, prune if the directory path itself is ignored
-                if not should_process(dir_full_path, patterns, root_dir): # Pass root_dir
-                    if DEBUG_MODE:
-                        print(f"DEBUG: Pruning directory from walk (blacklist): {dir_full_path}")
-                    dirs_to_prune_indices.append(i)
-
-            for i in sorted(dirs_to_prune_indices, reverse=True):
-                del dirnames[i]
+    # Prune ignored directories from the walk (only in blacklist mode)
+    prune = None
+    if apply_filter_to_structure:
+        prune = lambda dir_path: is_pruned_directory(dir_path, patterns, root_dir)
 
+    for dirpath, dirnames, filenames in walk_directory(root_dir, prune):
         # Now, decide which directories and files to list in the structure output
         list_dir_in_structure = False
         if not apply_filter_to_structure:
@@ -195,7 +343,8 @@ def combine_files(root_dir, output_file, patterns, run_parameters, patterns_cont
         out_f.write(patterns_content)
         out_f.write("\n\n")
 
-        for dirpath, dirnames, filenames in os.walk(root_dir):
+        prune = lambda dir_path: is_pruned_directory(dir_path, patterns, root_dir)
+        for dirpath, dirnames, filenames in walk_directory(root_dir, prune):
             if DEBUG_MODE:
                 print(f"DEBUG: Scanning directory: {dirpath}")
                 print(f"DEBUG: Files found: {filenames}")
@@ -216,18 +365,23 @@ def combine_files(root_dir, output_file, patterns, run_parameters, patterns_cont
 
 # Main function
 def main():
-    global DEBUG_MODE, MODE
+    global DEBUG_MODE, MODE, MAX_WORKERS
 
     parser = argparse.ArgumentParser(description="Combine code files from a directory.")
     parser.add_argument("root_dir", nargs='?', help="The root directory to process.")
     parser.add_argument("--mode", choices=["blacklist", "whitelist"], default="blacklist", help="Filtering mode (blacklist or whitelist). Defaults to blacklist.")
     parser.add_argument("--apply-filter-to-structure", action="store_true", help="Apply the filter to the directory structure output.")
     parser.add_argument("--debug", action="store_true", help="Enable debug mode.")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS, help=f"Number of threads listing directories concurrently. Defaults to {MAX_WORKERS}.")
 
     args = parser.parse_args()
 
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
     DEBUG_MODE = args.debug
     MODE = args.mode
+    MAX_WORKERS = args.workers
 
     if args.root_dir:
         # Non-interactive mode
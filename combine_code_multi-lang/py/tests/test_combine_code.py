@@ -8,8 +8,8 @@ from unittest.mock import patch
 # Add the parent directory to the sys.path to import combine_code
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-# Import the main function from the combine_code script
-from combine_code import main
+# Import the entry points under test from the combine_code script
+from combine_code import main, walk_directory
 
 # Define a fixture to create a temporary directory structure for testing (blacklist)
 @pytest.fixture
@@ -151,3 +151,70 @@ def test_non_interactive_whitelist(temp_project_whitelist): # Use the whitelist
 
 # TODO: Add more test cases (no filter on structure, different patterns, empty directories, etc.)
 # TODO: Add tests for interactive mode (requires mocking input)
+
+# Define a fixture with a deeper tree for exercising the concurrent traversal
+@pytest.fixture
+def temp_deep_tree():
+    temp_dir = tempfile.mkdtemp()
+
+    for top in ["b", "a", "c"]:
+        for sub in ["z", "x", "y"]:
+            os.makedirs(os.path.join(temp_dir, top, sub, "leaf"))
+            with open(os.path.join(temp_dir, top, sub, "leaf", "file.py"), "w") as f:
+                f.write("pass\n")
+        with open(os.path.join(temp_dir, top, "2.txt"), "w") as f:
+            f.write("two\n")
+        with open(os.path.join(temp_dir, top, "1.txt"), "w") as f:
+            f.write("one\n")
+
+    yield temp_dir
+
+    shutil.rmtree(temp_dir)
+
+# Sorted os.walk output, the order walk_directory is expected to reproduce
+def sorted_os_walk(root_dir):
+    result = []
+    for dirpath, dirnames, filenames in os.walk(root_dir):
+        dirnames.sort()
+        result.append((dirpath, list(dirnames), sorted(filenames)))
+    return result
+
+# Test that the concurrent walk matches a sorted os.walk for any worker count
+@pytest.mark.parametrize("max_workers", [1, 2, 8])
+def test_walk_directory_matches_sorted_os_walk(temp_deep_tree, max_workers):
+    walked = list(walk_directory(temp_deep_tree, max_workers=max_workers))
+    assert walked == sorted_os_walk(temp_deep_tree)
+
+# Test that pruned directories are neither yielded nor listed
+def test_walk_directory_prune(temp_deep_tree):
+    listed = []
+
+    def recording_scandir(path):
+        listed.append(path)
+        return os.scandir(path)
+
+    prune = lambda dir_path: os.path.basename(dir_path) == "x"
+    walked = list(walk_directory(temp_deep_tree, prune=prune, scandir=recording_scandir))
+
+    assert all(os.path.basename(dirpath) != "x" for dirpath, _, _ in walked)
+    assert all(os.sep + "x" not in path for path in listed)
+    assert walked[1] == (os.path.join(temp_deep_tree, "a"), ["y", "z"], ["1.txt", "2.txt"])
+
+# Test that removing entries from dirnames stops the walk descending into them, as with os.walk
+def test_walk_directory_dirnames_in_place(temp_deep_tree):
+    listed = []
+
+    def recording_scandir(path):
+        listed.append(path)
+        return os.scandir(path)
+
+    visited = []
+    for dirpath, dirnames, filenames in walk_directory(temp_deep_tree, scandir=recording_scandir):
+        visited.append(dirpath)
+        if dirpath == temp_deep_tree:
+            dirnames.remove("b")
+
+    removed_dir = os.path.join(temp_deep_tree, "b")
+    assert os.path.join(temp_deep_tree, "a", "x", "leaf") in visited
+    assert not any(path.startswith(removed_dir) for path in visited)
+    assert not any(path.startswith(removed_dir + os.sep) for path in listed)